@@ -11,6 +11,18 @@ Version: 1.0
 
 import random
 import numpy as np
+from ai_kernels import evaluate_position, line_score
+
+# 트랜스포지션 테이블 항목 종류
+TT_EXACT = 0       # 정확한 점수
+TT_LOWERBOUND = 1  # 베타 컷오프로 얻은 하한값
+TT_UPPERBOUND = 2  # 알파 이하로 떨어진 상한값
+
+# 국면별 후보 수 평가 캐시의 최대 항목 수
+EVAL_CACHE_SIZE = 5000
+
+# 킬러 수를 기억할 최대 탐색 깊이(ply)
+MAX_PLY = 16
 
 class AI:
     """
@@ -35,6 +47,19 @@ class AI:
         self.difficulty = difficulty  # 'Easy', 'Normal', 'Hard'
         self.player = 2  # AI는 백돌 (플레이어 2)
         self.opponent = 1  # 상대는 흑돌 (플레이어 1)
+        # 트랜스포지션 테이블: 대칭을 고려한 Zobrist 해시 -> (depth, score, flag, best_move)
+        self.tt = {}
+        # 히스토리 휴리스틱: 베타 컷오프를 일으킨 수 -> 누적 점수
+        self.history = {}
+        # 국면별 후보 수 평가 캐시: Zobrist 해시 -> [(평가 점수, (x, y)), ...]
+        # 항목 순서를 최근 사용 순으로 유지하여 가장 오래된 항목부터 버립니다.
+        self.eval_cache = {}
+        # 반복 심화에서 이전 깊이의 최선 수 (다음 깊이에서 가장 먼저 시도)
+        self.pv_move = None
+        # 킬러 수: ply별로 베타 컷오프를 일으킨 최근 2개의 수
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        # 현재 탐색의 시작 깊이 (ply = search_depth - depth)
+        self.search_depth = 0
     
     def get_best_move(self, board):
         """
@@ -48,35 +73,39 @@ class AI:
             
         Minimax 알고리즘을 사용하여 최적의 수를 계산합니다.
         """
-        valid_moves = board.get_valid_moves()
+        valid_moves = board.get_candidate_moves()
         
         if not valid_moves:
             return None
         
+        # 이전 수의 탐색 결과는 버림 (테이블 크기 제한)
+        self.tt.clear()
+        self.history.clear()
+        self.pv_move = None
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        
         # Easy 모드: 즉시 승리/즉시 패배(막기) 우선, 그 외엔 랜덤
         if self.difficulty == 'Easy':
             # 1. AI가 이길 수 있는 수
-            for x, y in valid_moves:
-                board.place_stone(x, y, self.player)
-                if board.check_win(x, y, self.player):
-                    board.board[y][x] = 0
-                    return (x, y)
-                board.board[y][x] = 0
+            winning_moves = board.get_winning_moves(self.player)
+            if winning_moves:
+                return winning_moves[0]
             # 2. 상대가 이길 수 있는 수 막기
-            for x, y in valid_moves:
-                board.place_stone(x, y, self.opponent)
-                if board.check_win(x, y, self.opponent):
-                    board.board[y][x] = 0
-                    return (x, y)
-                board.board[y][x] = 0
+            blocking_moves = board.get_winning_moves(self.opponent)
+            if blocking_moves:
+                return blocking_moves[0]
             # 3. 랜덤
             return random.choice(valid_moves)
         # Normal 모드: depth=1
         if self.difficulty == 'Normal':
             return self._minimax_move(board, depth=1)
-        # Hard 모드: depth=3
+        # Hard 모드: depth=3 (반복 심화)
         if self.difficulty == 'Hard':
-            return self._minimax_move(board, depth=3)
+            best_move = None
+            for depth in range(1, 4):
+                best_move = self._minimax_move(board, depth)
+                self.pv_move = best_move
+            return best_move
         # 기본값: Normal
         return self._minimax_move(board, depth=2)
 
@@ -96,7 +125,8 @@ class AI:
             
         Minimax 알고리즘으로 게임 트리를 탐색하고 최적의 수를 찾습니다.
         """
-        valid_moves = board.get_valid_moves()
+        self.search_depth = depth
+        valid_moves = self.order_moves(board, self.pv_move)
         
         if not valid_moves:
             return None
@@ -104,17 +134,17 @@ class AI:
         best_score = float('-inf')
         best_move = None
         
-        # 모든 유효한 수에 대해 평가
+        # 유망한 수부터 평가 (현재 최고 점수를 알파로 넘겨 가지치기)
         for move in valid_moves:
             x, y = move
             # 임시로 수를 놓아보기
-            board.place_stone(x, y, self.player)
+            board.set_stone(x, y, self.player)
             
             # Minimax로 점수 계산
-            score = self.minimax(board, depth - 1, False, float('-inf'), float('inf'))
+            score = self.minimax(board, depth - 1, False, best_score, float('inf'), move)
             
             # 수 되돌리기
-            board.board[y][x] = 0
+            board.remove_stone(x, y)
             
             # 최고 점수 업데이트
             if score > best_score:
@@ -123,7 +153,7 @@ class AI:
         
         return best_move
     
-    def minimax(self, board, depth, is_maximizing, alpha, beta):
+    def minimax(self, board, depth, is_maximizing, alpha, beta, last_move=None):
         """
         Minimax 알고리즘 (알파-베타 가지치기 포함)
         
@@ -133,75 +163,188 @@ class AI:
             is_maximizing (bool): 최대화 플레이어인지 여부
             alpha (float): 알파 값
             beta (float): 베타 값
+            last_move (tuple): 이 국면을 만든 마지막 수 (x, y)
             
         Returns:
             float: 평가 점수
             
         Minimax 알고리즘으로 게임 트리를 탐색하고 최적의 수를 찾습니다.
         """
+        # 트랜스포지션 테이블 조회
+        alpha_orig, beta_orig = alpha, beta
+        tt_move = None
+        tt_key, symmetry = board.canonical_key()
+        entry = self.tt.get(tt_key)
+        if entry is not None:
+            tt_depth, tt_score, tt_flag, tt_move = entry
+            # 최선 수는 대표(대칭 변환된) 국면 기준 좌표로 저장되어 있음
+            if tt_move is not None:
+                tt_move = board.inverse_transform_move(tt_move, symmetry)
+            if tt_depth >= depth:
+                if tt_flag == TT_EXACT:
+                    return tt_score
+                if tt_flag == TT_LOWERBOUND:
+                    alpha = max(alpha, tt_score)
+                else:
+                    beta = min(beta, tt_score)
+                if beta <= alpha:
+                    return tt_score
+        
         # 종료 조건: 깊이 도달 또는 게임 종료
-        if depth == 0 or self.is_game_over(board):
+        if depth == 0 or self.is_game_over(board, last_move):
             return self.evaluate_board(board)
         
-        valid_moves = board.get_valid_moves()
+        # 이전에 찾은 최선의 수를 먼저, 나머지는 유망한 순서로 시도
+        ply = self.search_depth - depth
+        valid_moves = self.order_moves(board, tt_move, self.killers[ply])
         
+        best_move = None
         if is_maximizing:
             # 최대화 플레이어 (AI)
-            max_score = float('-inf')
+            best_score = float('-inf')
             for move in valid_moves:
                 x, y = move
-                board.place_stone(x, y, self.player)
-                score = self.minimax(board, depth - 1, False, alpha, beta)
-                board.board[y][x] = 0  # 수 되돌리기
+                board.set_stone(x, y, self.player)
+                score = self.minimax(board, depth - 1, False, alpha, beta, move)
+                board.remove_stone(x, y)  # 수 되돌리기
                 
-                max_score = max(max_score, score)
+                if score > best_score:
+                    best_score = score
+                    best_move = move
                 alpha = max(alpha, score)
                 
                 # 알파-베타 가지치기
                 if beta <= alpha:
+                    self.record_cutoff(move, depth, ply)
                     break
-            return max_score
         else:
             # 최소화 플레이어 (상대)
-            min_score = float('inf')
+            best_score = float('inf')
             for move in valid_moves:
                 x, y = move
-                board.place_stone(x, y, self.opponent)
-                score = self.minimax(board, depth - 1, True, alpha, beta)
-                board.board[y][x] = 0  # 수 되돌리기
+                board.set_stone(x, y, self.opponent)
+                score = self.minimax(board, depth - 1, True, alpha, beta, move)
+                board.remove_stone(x, y)  # 수 되돌리기
                 
-                min_score = min(min_score, score)
+                if score < best_score:
+                    best_score = score
+                    best_move = move
                 beta = min(beta, score)
                 
                 # 알파-베타 가지치기
                 if beta <= alpha:
+                    self.record_cutoff(move, depth, ply)
                     break
-            return min_score
+        
+        # 트랜스포지션 테이블 저장
+        if best_score <= alpha_orig:
+            flag = TT_UPPERBOUND
+        elif best_score >= beta_orig:
+            flag = TT_LOWERBOUND
+        else:
+            flag = TT_EXACT
+        if best_move is not None:
+            best_move = board.transform_move(best_move, symmetry)
+        self.tt[tt_key] = (depth, best_score, flag, best_move)
+        return best_score
+    
+    def order_moves(self, board, first_move=None, killers=()):
+        """
+        수 정렬 (알파-베타 가지치기 효율 향상)
+        
+        Args:
+            board: Board 클래스 인스턴스
+            first_move (tuple): 가장 먼저 시도할 수 (트랜스포지션 테이블의 최선 수)
+            killers (list): first_move 다음으로 시도할 킬러 수들
+            
+        Returns:
+            list: 정렬된 후보 수 목록 [(x, y), ...]
+            
+        후보 수를 평가 점수 순으로 정렬하고,
+        같은 점수에서는 히스토리 점수가 높은 수를 먼저 배치합니다.
+        그 앞에 최선 수, 킬러 수 순서로 놓습니다.
+        """
+        scored = self.get_scored_moves(board)
+        if self.history:
+            scored = sorted(scored, key=lambda item: (item[0], self.history.get(item[1], 0)),
+                            reverse=True)
+        ordered = [move for _, move in scored]
+        front = 0
+        for move in (first_move, *killers):
+            if move in ordered[front:]:
+                ordered.remove(move)
+                ordered.insert(front, move)
+                front += 1
+        return ordered
+    
+    def record_cutoff(self, move, depth, ply):
+        """
+        베타 컷오프를 일으킨 수 기록
+        
+        Args:
+            move (tuple): 컷오프를 일으킨 수 (x, y)
+            depth (int): 남은 탐색 깊이
+            ply (int): 탐색 시작점으로부터의 깊이
+            
+        히스토리 점수를 올리고, 같은 ply의 킬러 수로 등록합니다.
+        """
+        self.history[move] = self.history.get(move, 0) + depth * depth
+        killers = self.killers[ply]
+        if move != killers[0]:
+            self.killers[ply] = [move, killers[0]]
+    
+    def get_scored_moves(self, board):
+        """
+        후보 수 평가 (캐시 사용)
+        
+        Args:
+            board: Board 클래스 인스턴스
+            
+        Returns:
+            list: 점수가 높은 순으로 정렬된 [(평가 점수, (x, y)), ...]
+            
+        각 후보 수를 공격 점수(흑 기준)와 방어 점수(백 기준)의 합으로 평가합니다.
+        이 점수는 어느 쪽 차례인지와 무관하므로 국면의 Zobrist 해시로 캐시하여
+        반복 심화나 트랜스포지션으로 같은 국면을 다시 만날 때 재사용합니다.
+        """
+        key = board.hash
+        scored = self.eval_cache.pop(key, None)
+        if scored is None:
+            scored = sorted(
+                ((self.evaluate_position(board, x, y, 1) +
+                  self.evaluate_position(board, x, y, 2), (x, y))
+                 for x, y in board.get_candidate_moves()),
+                key=lambda item: item[0], reverse=True)
+            if len(self.eval_cache) >= EVAL_CACHE_SIZE:
+                # 가장 오래 사용하지 않은 항목 제거
+                del self.eval_cache[next(iter(self.eval_cache))]
+        # 가장 최근에 사용한 항목으로 다시 넣음
+        self.eval_cache[key] = scored
+        return scored
     
-    def is_game_over(self, board):
+    def is_game_over(self, board, last_move=None):
         """
         게임 종료 여부 확인
         
         Args:
             board: Board 클래스 인스턴스
+            last_move (tuple): 마지막으로 놓은 수 (x, y)
             
         Returns:
             bool: 게임이 종료되었는지 여부
             
         승리 조건 달성 또는 바둑판 가득 참을 확인합니다.
+        직전 수 이전에는 게임이 끝나지 않았으므로 마지막 수만 확인하면 됩니다.
         """
         # 바둑판이 가득 찬 경우
         if board.is_full():
             return True
         
-        # 승리 조건 확인
-        for y in range(board.size):
-            for x in range(board.size):
-                if board.board[y][x] != 0:
-                    if board.check_win(x, y, board.board[y][x]):
-                        return True
-        
-        return False
+        # 마지막 수로 승리했는지 확인
+        if last_move is None:
+            return False
+        x, y = last_move
+        return board.check_win(x, y, board.board[y, x])
     
     def evaluate_board(self, board):
         """
@@ -215,22 +358,8 @@ class AI:
             
         현재 바둑판 상태를 평가하여 점수를 계산합니다.
         """
-        score = 0
-        
-        # 각 위치의 돌을 평가
-        for y in range(board.size):
-            for x in range(board.size):
-                if board.board[y][x] != 0:
-                    player = board.board[y][x]
-                    position_score = self.evaluate_position(board, x, y, player)
-                    
-                    # AI 돌이면 양수, 상대 돌이면 음수
-                    if player == self.player:
-                        score += position_score
-                    else:
-                        score -= position_score
-        
-        return score
+        # 바둑판이 돌을 놓고 뺄 때마다 점수를 갱신해 두므로 바로 사용
+        return board.score[self.player] - board.score[self.opponent]
     
     def evaluate_position(self, board, x, y, player):
         """
@@ -248,45 +377,7 @@ class AI:
         특정 위치의 돌이 얼마나 유용한지 평가합니다.
         연속된 돌의 개수와 막힌 끝의 개수를 고려합니다.
         """
-        directions = [(1, 0), (0, 1), (1, 1), (1, -1)]  # 가로, 세로, 대각선
-        total_score = 0
-        
-        for dx, dy in directions:
-            # 양방향으로 연속된 돌 개수 확인
-            count = 1  # 현재 돌 포함
-            blocked = 0  # 막힌 끝의 개수
-            
-            # 정방향 확인
-            nx, ny = x + dx, y + dy
-            while 0 <= nx < board.size and 0 <= ny < board.size:
-                if board.board[ny][nx] == player:
-                    count += 1
-                elif board.board[ny][nx] != 0:
-                    blocked += 1
-                    break
-                else:
-                    break
-                nx += dx
-                ny += dy
-            
-            # 역방향 확인
-            nx, ny = x - dx, y - dy
-            while 0 <= nx < board.size and 0 <= ny < board.size:
-                if board.board[ny][nx] == player:
-                    count += 1
-                elif board.board[ny][nx] != 0:
-                    blocked += 1
-                    break
-                else:
-                    break
-                nx -= dx
-                ny -= dy
-            
-            # 점수 계산
-            score = self.calculate_line_score(count, blocked)
-            total_score += score
-        
-        return total_score
+        return evaluate_position(board.board, x, y, player)
     
     def calculate_line_score(self, count, blocked):
         """
@@ -301,22 +392,7 @@ class AI:
             
         연속된 돌의 개수와 막힌 끝의 개수에 따라 점수를 계산합니다.
         """
-        # 승리 조건 (5개 연속)
-        if count >= 5:
-            return 100000
-        
-        # 막힌 끝이 2개면 점수 없음
-        if blocked == 2:
-            return 0
-        
-        # 점수 계산 (연속된 돌 개수에 따라 지수적으로 증가)
-        base_score = 10 ** (count - 1)
-        
-        # 막힌 끝이 1개면 점수 절반
-        if blocked == 1:
-            base_score //= 2
-        
-        return base_score
+        return line_score(count, blocked)
     
     def get_random_move(self, board):
         """
@@ -10,6 +10,15 @@ Version: 1.0
 """
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from ai_kernels import score_line
+
+# 평가에 사용하는 4방향 (가로, 세로, 우하향 대각선, 우상향 대각선)
+LINE_DIRECTIONS = [(1, 0), (0, 1), (1, 1), (1, -1)]
+
+# 돌이 이 개수보다 적을 때만 대칭(회전/반사) 국면을 같은 국면으로 취급
+# 돌이 많아지면 대칭 국면이 다시 나올 일이 거의 없습니다.
+SYMMETRY_STONE_LIMIT = 10
 
 class Board:
     """
@@ -33,11 +42,65 @@ class Board:
         0: 빈 칸, 1: 흑돌, 2: 백돌
         """
         self.size = size
-        # 바둑판을 2D 배열로 초기화 (0: 빈 칸)
-        self.board = np.zeros((size, size), dtype=int)
+        # 바둑판을 2D 배열로 초기화 (0: 빈 칸, JIT 커널과 같은 int8 사용)
+        self.board = np.zeros((size, size), dtype=np.int8)
         
         # 승리 조건: 5개 연속
         self.win_length = 5
+        
+        # 비트보드: 플레이어별 돌 위치를 Python 정수의 비트로 표현
+        # 각 행 끝에 항상 0인 보호 칸을 두어 (행 폭 size + 1)
+        # 비트를 밀 때 다음 행으로 넘어가 이어지는 일이 없도록 합니다.
+        self.bb_stride = size + 1
+        self.black_bb = 0
+        self.white_bb = 0
+        # 4방향(가로, 세로, 우하향, 우상향)의 비트 이동량
+        self.bb_shifts = (1, self.bb_stride, self.bb_stride + 1, self.bb_stride - 1)
+        # win_masks[방향][비트 위치]: 그 칸을 지나는 길이 5 구간의 시작 비트들
+        self.win_masks = []
+        for shift in self.bb_shifts:
+            masks = []
+            for pos in range(size * self.bb_stride):
+                mask = 0
+                for k in range(self.win_length):
+                    if pos - k * shift >= 0:
+                        mask |= 1 << (pos - k * shift)
+                masks.append(mask)
+            self.win_masks.append(masks)
+        
+        # Zobrist 해시: (y, x, 플레이어)마다 고정된 64비트 난수
+        # 시드를 고정하여 바둑판 인스턴스가 달라도 같은 국면은 같은 해시를 가집니다.
+        self.zobrist = np.random.SeedSequence(0).generate_state(
+            size * size * 2, dtype=np.uint64).reshape(size, size, 2)
+        
+        # 8가지 대칭 변환(회전 4 x 반사 2): sym_cells[k][칸 번호] = 변환된 칸 번호
+        # 칸 번호는 y * size + x 이며, k = 0은 항등 변환입니다.
+        ys, xs = np.divmod(np.arange(size * size, dtype=np.int32), size)
+        self.sym_cells = np.empty((8, size * size), dtype=np.int32)
+        for k in range(8):
+            tx, ty = (size - 1 - xs, ys) if k >= 4 else (xs, ys)
+            for _ in range(k % 4):
+                tx, ty = size - 1 - ty, tx  # 90도 회전
+            self.sym_cells[k] = ty * size + tx
+        self.sym_inverse = np.argsort(self.sym_cells, axis=1).astype(np.int32)
+        # sym_zobrist[k, y, x, p]: k번 변환한 국면에서 (x, y) 돌이 기여하는 키
+        self.sym_zobrist = self.zobrist.reshape(size * size, 2)[self.sym_cells].reshape(8, size, size, 2)
+        # hashes[k]: k번 변환한 국면의 해시 (hashes[0]이 원래 국면의 해시)
+        self.hashes = np.zeros(8, dtype=np.uint64)
+        # 놓인 돌의 개수
+        self.stone_count = 0
+        
+        # 각 방향의 줄(line)을 이루는 칸들의 인덱스: lines[방향][줄 번호] = (ys, xs)
+        self.lines = [{} for _ in LINE_DIRECTIONS]
+        for y in range(size):
+            for x in range(size):
+                for d, key in enumerate(self.line_keys(x, y)):
+                    self.lines[d].setdefault(key, []).append((y, x))
+        for lines in self.lines:
+            for key, cells in lines.items():
+                ys, xs = zip(*cells)
+                lines[key] = (np.array(ys), np.array(xs))
+        self.reset_score()
     
     def is_valid_move(self, x, y):
         """
@@ -57,7 +120,7 @@ class Board:
             return False
         
         # 빈 칸인지 확인
-        return self.board[y][x] == 0
+        return self.board[y, x] == 0
     
     def place_stone(self, x, y, player):
         """
@@ -74,75 +137,223 @@ class Board:
         지정된 위치에 돌을 놓습니다.
         """
         if self.is_valid_move(x, y):
-            self.board[y][x] = player
+            self.set_stone(x, y, player)
             return True
         return False
     
-    def check_win(self, x, y, player):
+    def place_stones(self, coords, player):
         """
-        승리 조건 확인
+        여러 개의 돌 한 번에 놓기
         
         Args:
-            x (int): 마지막으로 놓은 돌의 x 좌표
-            y (int): 마지막으로 놓은 돌의 y 좌표
+            coords (list): 돌을 놓을 (x, y) 좌표 목록
             player (int): 플레이어 (1: 흑, 2: 백)
             
         Returns:
-            bool: 승리했는지 여부
+            bool: 돌을 놓았는지 여부
+            
+        모든 좌표가 바둑판 범위 내의 서로 다른 빈 칸일 때만 한 번에 놓습니다.
+        해시와 비트보드는 한 번에 갱신하고, 평가 점수는 영향을 받는 줄마다 한 번만 다시 계산합니다.
+        """
+        coords = np.asarray(coords, dtype=np.intp).reshape(-1, 2)
+        xs, ys = coords[:, 0], coords[:, 1]
+        # 범위, 빈 칸, 중복 확인
+        if not ((xs >= 0) & (xs < self.size) & (ys >= 0) & (ys < self.size)).all():
+            return False
+        if self.board[ys, xs].any() or len(np.unique(ys * self.size + xs)) != len(coords):
+            return False
+        
+        self.board[ys, xs] = player
+        self.hashes ^= np.bitwise_xor.reduce(self.sym_zobrist[:, ys, xs, player - 1], axis=1)
+        bits = 0
+        for pos in (ys * self.bb_stride + xs).tolist():
+            bits |= 1 << pos
+        if player == 1:
+            self.black_bb |= bits
+        else:
+            self.white_bb |= bits
+        self.stone_count += len(coords)
+        for d, keys in enumerate((ys, xs, xs - ys + self.size - 1, xs + ys)):
+            for key in set(keys.tolist()):
+                self.update_line_score(d, key)
+        return True
+    
+    def set_stone(self, x, y, player):
+        """
+        돌 놓기 (유효성 검사 없음)
+        
+        Args:
+            x (int): x 좌표
+            y (int): y 좌표
+            player (int): 플레이어 (1: 흑, 2: 백)
+            
+        이미 빈 칸으로 확인된 후보 수를 AI 탐색에서 놓을 때 사용합니다.
+        해시, 비트보드, 돌 개수, 평가 점수를 함께 갱신합니다.
+        """
+        self.board[y, x] = player
+        self.hashes ^= self.sym_zobrist[:, y, x, player - 1]
+        if player == 1:
+            self.black_bb |= 1 << (y * self.bb_stride + x)
+        else:
+            self.white_bb |= 1 << (y * self.bb_stride + x)
+        self.stone_count += 1
+        self.update_score(x, y)
+    
+    def remove_stone(self, x, y):
+        """
+        돌 제거 (수 되돌리기)
+        
+        Args:
+            x (int): x 좌표
+            y (int): y 좌표
             
-        마지막으로 놓은 돌을 기준으로 8방향을 확인하여
-        5개 연속이 있는지 확인합니다.
+        AI 탐색에서 임시로 놓은 돌을 되돌릴 때 사용합니다.
+        Zobrist 해시, 돌 개수, 평가 점수도 함께 되돌립니다.
+        """
+        player = self.board[y, x]
+        if player != 0:
+            self.hashes ^= self.sym_zobrist[:, y, x, player - 1]
+            if player == 1:
+                self.black_bb &= ~(1 << (y * self.bb_stride + x))
+            else:
+                self.white_bb &= ~(1 << (y * self.bb_stride + x))
+            self.board[y, x] = 0
+            self.stone_count -= 1
+            self.update_score(x, y)
+    
+    @property
+    def hash(self):
         """
-        # 확인할 8방향 (가로, 세로, 대각선)
-        directions = [
-            (1, 0),   # 가로
-            (0, 1),   # 세로
-            (1, 1),   # 우하향 대각선
-            (1, -1)   # 우상향 대각선
-        ]
+        현재 국면의 Zobrist 해시
         
-        for dx, dy in directions:
-            # 양방향으로 연속된 돌 개수 확인
-            count = 1  # 현재 돌 포함
+        Returns:
+            numpy.uint64: 해시 값
+        """
+        return self.hashes[0]
+    
+    def canonical_key(self):
+        """
+        대칭을 고려한 국면 키
+        
+        Returns:
+            tuple: (해시, 대칭 변환 번호)
             
-            # 정방향 확인
-            count += self.count_direction(x, y, dx, dy, player)
-            # 역방향 확인
-            count += self.count_direction(x, y, -dx, -dy, player)
+        초반에는 8가지 대칭 국면의 해시 중 가장 작은 값을 키로 사용하여
+        회전/반사만 다른 국면들이 같은 키를 갖게 합니다.
+        """
+        if self.stone_count < SYMMETRY_STONE_LIMIT:
+            k = int(self.hashes.argmin())
+            return self.hashes[k], k
+        return self.hashes[0], 0
+    
+    def transform_move(self, move, k):
+        """
+        수 좌표를 k번 대칭 변환
+        
+        Args:
+            move (tuple): (x, y)
+            k (int): 대칭 변환 번호
             
-            # 5개 이상 연속이면 승리
-            if count >= self.win_length:
-                return True
+        Returns:
+            tuple: 변환된 (x, y)
+        """
+        cell = int(self.sym_cells[k, move[1] * self.size + move[0]])
+        return (cell % self.size, cell // self.size)
+    
+    def inverse_transform_move(self, move, k):
+        """
+        k번 대칭 변환된 수 좌표를 원래 좌표로 되돌림
         
-        return False
+        Args:
+            move (tuple): 변환된 (x, y)
+            k (int): 대칭 변환 번호
+            
+        Returns:
+            tuple: 원래 (x, y)
+        """
+        cell = int(self.sym_inverse[k, move[1] * self.size + move[0]])
+        return (cell % self.size, cell // self.size)
     
-    def count_direction(self, x, y, dx, dy, player):
+    def line_keys(self, x, y):
         """
-        특정 방향으로 연속된 돌 개수 세기
+        (x, y)를 지나는 4방향 줄 번호
         
         Args:
-            x (int): 시작 x 좌표
-            y (int): 시작 y 좌표
-            dx (int): x 방향
-            dy (int): y 방향
-            player (int): 플레이어
+            x (int): x 좌표
+            y (int): y 좌표
             
         Returns:
-            int: 연속된 돌 개수
+            tuple: LINE_DIRECTIONS 순서의 줄 번호
+        """
+        return (y, x, x - y + self.size - 1, x + y)
+    
+    def reset_score(self):
+        """
+        평가 점수 초기화
+        
+        빈 바둑판 기준으로 줄별 점수와 플레이어별 총점을 0으로 만듭니다.
+        score[1]: 흑돌 점수, score[2]: 백돌 점수
+        """
+        self.score = [0, 0, 0]
+        self.line_scores = [{key: (0, 0) for key in lines} for lines in self.lines]
+    
+    def update_score(self, x, y):
+        """
+        평가 점수 갱신
+        
+        Args:
+            x (int): 바뀐 칸의 x 좌표
+            y (int): 바뀐 칸의 y 좌표
             
-        지정된 방향으로 같은 플레이어의 돌이 연속으로 몇 개 있는지 셉니다.
+        바뀐 칸을 지나는 4개의 줄만 다시 계산하여 차이만큼 총점에 반영합니다.
+        """
+        for d, key in enumerate(self.line_keys(x, y)):
+            self.update_line_score(d, key)
+    
+    def update_line_score(self, d, key):
         """
-        count = 0
-        nx, ny = x + dx, y + dy
+        한 줄의 평가 점수 갱신
         
-        # 바둑판 범위 내에서 같은 플레이어의 돌이 연속되는 동안 카운트
-        while (0 <= nx < self.size and 0 <= ny < self.size and 
-               self.board[ny][nx] == player):
-            count += 1
-            nx += dx
-            ny += dy
+        Args:
+            d (int): 방향 번호 (LINE_DIRECTIONS 순서)
+            key (int): 줄 번호
+            
+        줄 점수를 다시 계산하여 이전 점수와의 차이만큼 총점에 반영합니다.
+        """
+        ys, xs = self.lines[d][key]
+        new = score_line(self.board[ys, xs])
+        old = self.line_scores[d][key]
+        self.score[1] += new[0] - old[0]
+        self.score[2] += new[1] - old[1]
+        self.line_scores[d][key] = new
+    
+    def check_win(self, x, y, player):
+        """
+        승리 조건 확인
         
-        return count
+        Args:
+            x (int): 마지막으로 놓은 돌의 x 좌표
+            y (int): 마지막으로 놓은 돌의 y 좌표
+            player (int): 플레이어 (1: 흑, 2: 백)
+            
+        Returns:
+            bool: 승리했는지 여부
+            
+        비트보드를 방향별로 밀어 AND 하여 마지막으로 놓은 돌을
+        지나는 5개 연속이 있는지 확인합니다.
+        """
+        bb = self.black_bb if player == 1 else self.white_bb
+        pos = y * self.bb_stride + x
+        for d, shift in enumerate(self.bb_shifts):
+            # 2칸 -> 4칸 -> 5칸 연속으로 늘려 가며 AND (시프트 3번)
+            # five의 비트 i: i부터 shift 간격으로 5칸이 모두 player의 돌
+            five = bb & (bb >> shift)
+            five &= five >> 2 * shift
+            five &= bb >> 4 * shift
+            # 그중 (x, y)를 지나는 구간이 있으면 승리
+            if five & self.win_masks[d][pos]:
+                return True
+        return False
     
     def get_board_state(self):
         """
@@ -170,7 +381,68 @@ class Board:
                 if self.is_valid_move(x, y):
                     valid_moves.append((x, y))
         return valid_moves
-    
+
+    def get_candidate_moves(self, radius=2):
+        """
+        후보 수 목록 반환 (AI 탐색용)
+
+        Args:
+            radius (int): 기존 돌로부터의 최대 거리 (체비셰프 거리)
+
+        Returns:
+            list: 후보 수들의 좌표 리스트 [(x, y), ...]
+
+        이미 놓인 돌 주변 radius칸 이내의 빈 칸만 반환하여 탐색 폭을 줄입니다.
+        바둑판이 비어 있으면 중앙 한 칸만 반환합니다.
+        """
+        occupied = self.board != 0
+        if not occupied.any():
+            center = self.size // 2
+            return [(center, center)]
+
+        # 정사각형 팽창은 행/열 방향으로 나누어 처리할 수 있음
+        padded = np.pad(occupied, ((radius, radius), (0, 0)))
+        near = np.zeros_like(occupied)
+        for k in range(2 * radius + 1):
+            near |= padded[k:k + self.size, :]
+        padded = np.pad(near, ((0, 0), (radius, radius)))
+        near = np.zeros_like(occupied)
+        for k in range(2 * radius + 1):
+            near |= padded[:, k:k + self.size]
+
+        ys, xs = np.nonzero(near & ~occupied)
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def get_winning_moves(self, player):
+        """
+        즉시 승리하는 수 목록 반환
+
+        Args:
+            player (int): 플레이어 (1: 흑, 2: 백)
+
+        Returns:
+            list: 놓으면 바로 5개 연속이 되는 빈 칸 좌표 리스트 [(x, y), ...]
+
+        빈 칸을 포함하는 길이 5 구간 중 나머지 4칸이 모두 player의 돌인
+        구간이 있는지를 바둑판 전체에 대해 한 번에 계산합니다.
+        """
+        n = self.size
+        pad = self.win_length - 1
+        padded = np.pad(self.board == player, pad).astype(np.int8)
+        wins = np.zeros((n, n), dtype=bool)
+        for dx, dy in LINE_DIRECTIONS:
+            # shifted[m][y, x]: (x + m*dx, y + m*dy) 칸이 player의 돌인지 (m = -4..4)
+            shifted = np.stack([
+                padded[pad + m * dy:pad + m * dy + n, pad + m * dx:pad + m * dx + n]
+                for m in range(-pad, pad + 1)
+            ])
+            # 각 칸을 포함하는 길이 5 구간 5개의 돌 개수
+            counts = sliding_window_view(shifted, self.win_length, axis=0).sum(axis=-1)
+            wins |= (counts == self.win_length - 1).any(axis=0)
+
+        ys, xs = np.nonzero(wins & (self.board == 0))
+        return list(zip(xs.tolist(), ys.tolist()))
+
     def is_full(self):
         """
         바둑판이 가득 찼는지 확인
@@ -180,15 +452,21 @@ class Board:
             
         모든 칸에 돌이 놓여졌는지 확인합니다.
         """
-        return np.all(self.board != 0)
+        return self.stone_count == self.size * self.size
     
     def reset(self):
         """
         바둑판 초기화
         
         바둑판을 빈 상태로 초기화합니다.
+        배열을 새로 만들지 않고 기존 배열을 0으로 채워 다시 사용합니다.
         """
-        self.board = np.zeros((self.size, self.size), dtype=int)
+        self.board.fill(0)
+        self.hashes.fill(0)
+        self.black_bb = 0
+        self.white_bb = 0
+        self.stone_count = 0
+        self.reset_score()
     
     def print_board(self):
         """
@@ -197,13 +475,14 @@ class Board:
         현재 바둑판 상태를 콘솔에 출력합니다.
         0: 빈 칸, 1: 흑돌, 2: 백돌
         """
+        board = self.board
         print("  " + " ".join([f"{i:2}" for i in range(self.size)]))
         for y in range(self.size):
             row = f"{y:2} "
             for x in range(self.size):
-                if self.board[y][x] == 0:
+                if board[y, x] == 0:
                     row += " ."
-                elif self.board[y][x] == 1:
+                elif board[y, x] == 1:
                     row += " ●"  # 흑돌
                 else:
                     row += " ○"  # 백돌
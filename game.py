@@ -36,6 +36,9 @@ class Game:
         self.current_player = 1
         self.show_main_menu = True
         self.show_settings = False
+        # 화면 일부만 갱신하기 위한 상태: 직전에 그린 화면 종류, 전체 갱신 필요 여부
+        self.last_view = None
+        self.full_redraw = True
 
     def run(self):
         while self.running:
@@ -53,6 +56,10 @@ class Game:
                 self.width, self.height = event.w, event.h
                 self.screen = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
                 self.renderer.set_screen_size(self.width, self.height)
+                self.full_redraw = True
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE, pygame.WINDOWRESTORED):
+                # 창이 다시 보이게 되면 바뀐 영역이 없어도 전체를 다시 보여줌
+                self.full_redraw = True
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     if self.show_settings:
@@ -186,11 +193,14 @@ class Game:
     def render(self):
         self.screen.fill((128, 128, 128))
         self.buttons = {}
+        dirty_rects = []
         if self.show_main_menu:
-            self.renderer.render_main_menu(self.screen, self.buttons)
+            view = 'main_menu'
+            dirty_rects += self.renderer.render_main_menu(self.screen, self.buttons)
         elif self.show_settings:
-            self.renderer.render_board(self.screen, self.board.get_board_state())
-            self.renderer.render_menu_panel(
+            view = 'settings'
+            dirty_rects += self.renderer.render_board(self.screen, self.board.get_board_state())
+            dirty_rects += self.renderer.render_menu_panel(
                 self.screen,
                 self.current_player,
                 self.game_mode,
@@ -200,10 +210,11 @@ class Game:
                 self.buttons,
                 show_settings_btn=False
             )
-            self.renderer.render_settings_panel(self.screen, self.buttons)
+            dirty_rects += self.renderer.render_settings_panel(self.screen, self.buttons)
         else:
-            self.renderer.render_board(self.screen, self.board.get_board_state())
-            self.renderer.render_menu_panel(
+            view = 'game'
+            dirty_rects += self.renderer.render_board(self.screen, self.board.get_board_state())
+            dirty_rects += self.renderer.render_menu_panel(
                 self.screen,
                 self.current_player,
                 self.game_mode,
@@ -213,4 +224,14 @@ class Game:
                 self.buttons,
                 show_settings_btn=True
             )
-        pygame.display.flip() 
\ No newline at end of file
+        self.update_display(view, dirty_rects)
+
+    def update_display(self, view, dirty_rects):
+        # 화면 종류가 바뀌었거나 창 크기가 바뀌었거나, 바뀐 영역이 화면의 절반을 넘으면 전체 갱신
+        dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+        if view != self.last_view or self.full_redraw or dirty_area > 0.5 * self.width * self.height:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+        self.last_view = view
+        self.full_redraw = False 
\ No newline at end of file
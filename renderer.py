@@ -9,9 +9,25 @@ Author: 3D Gomoku Development Team
 Version: 1.0
 """
 
+import math
 import pygame
 import numpy as np
-from utils import COLORS, board_to_screen_pos, draw_text, get_stone_color
+from utils import COLORS, blit_batch, convert_surface, draw_text, fill_batch, get_stone_color
+
+# 메인 메뉴/설정 패널 버튼: (버튼 이름, 색상 이름, 글자)
+MAIN_MENU_BUTTONS = [
+    ('2player', 'GREEN', "2 Player Mode"),
+    ('ai_easy', 'BLUE', "AI Mode (Easy)"),
+    ('ai_normal', 'ORANGE', "AI Mode (Normal)"),
+    ('ai_hard', 'RED', "AI Mode (Hard)"),
+]
+SETTINGS_BUTTONS = [
+    ('set_2player', 'GREEN', "2 Player Mode"),
+    ('set_ai_easy', 'BLUE', "AI Mode (Easy)"),
+    ('set_ai_normal', 'ORANGE', "AI Mode (Normal)"),
+    ('set_ai_hard', 'RED', "AI Mode (Hard)"),
+    ('close_settings', 'GRAY', "Close"),
+]
 
 class Renderer:
     def __init__(self, screen_width: int = 1400, screen_height: int = 900):
@@ -24,6 +40,25 @@ class Renderer:
         self.button_font = pygame.font.Font(None, 28)
         self.info_font = pygame.font.Font(None, 24)
         self.small_font = pygame.font.Font(None, 16)
+        # 톱니바퀴 아이콘의 톱니 8개 방향 (45도 간격 단위 벡터)
+        self._gear_offsets = [(math.cos(math.radians(i * 45)), math.sin(math.radians(i * 45))) for i in range(8)]
+        # 메뉴 패널 캐시: 상태 키가 같으면 저장된 이미지와 버튼 영역을 재사용
+        self._menu_cache = None
+        self._menu_key = None
+        self._menu_buttons = {}
+        # 메뉴 패널에 나오는 글자는 경우의 수가 적으므로 모두 미리 렌더링
+        self._player_labels = {
+            player: self.info_font.render(f"Player: {name}", True, COLORS['BLACK'])
+            for player, name in ((1, 'Black'), (2, 'White'))
+        }
+        self._mode_labels = {
+            (game_mode, ai_difficulty): self.info_font.render(f"Mode: {game_mode} ({ai_difficulty})", True, COLORS['BLACK'])
+            for game_mode in ('2 Player', 'AI Mode') for ai_difficulty in ('Easy', 'Normal', 'Hard')
+        }
+        self._winner_labels = {
+            player: self.button_font.render(f"{name} Wins!", True, COLORS['BLACK'])
+            for player, name in ((1, 'Black'), (2, 'White'))
+        }
 
     def update_layout(self):
         # 좌측 3/4 바둑판, 우측 1/4 메뉴
@@ -38,6 +73,74 @@ class Renderer:
         self.menu_y = 0
         self.menu_width = self.menu_area_width
         self.menu_height = self.screen_height
+        # 바둑판 배경과 격자는 변하지 않으므로 레이아웃이 바뀔 때만 미리 그려 둠
+        self._grid_surface = pygame.Surface((self.board_width, self.board_height))
+        self._grid_surface.fill(COLORS['LIGHT_BROWN'])
+        self._render_grid(self._grid_surface)
+        # 각 열/행 교차점의 바둑판 내부 좌표 (board_to_screen_pos와 같은 계산)
+        cell = self.board_width / (self.board_size + 1)
+        lines = np.arange(self.board_size) + 1
+        self._col_x = (lines * cell).astype(np.int32)
+        self._row_y = (lines * cell).astype(np.int32)
+        # 바둑판(격자 + 돌) 캐시는 다음 그리기 때 새 크기로 다시 만듦
+        self._board_cache = None
+        self._board_key = None
+        self._board_state = None
+        self._last_move = None
+        # 돌 이미지 (그림자 포함): (플레이어, 마지막 수 여부) -> Surface
+        self.stone_radius = int(self.cell_size * 0.4)
+        self._stone_offset = self.stone_radius + 4
+        self._stone_sprites = {
+            (player, is_last_move): self._render_stone(player, is_last_move)
+            for player in (1, 2) for is_last_move in (False, True)
+        }
+        # 메인 메뉴 캐시는 다음 그리기 때 새 크기로 다시 만듦
+        self._main_menu_surface = None
+        # 메인 메뉴/설정 패널의 버튼 영역은 화면 크기에만 의존하므로 미리 계산
+        self._layout_main_menu()
+        self._layout_settings_panel()
+        # 설정 패널 뒤를 어둡게 덮는 반투명 화면
+        self._dim_overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+        self._dim_overlay.fill((0,0,0,120))
+        # 미리 그린 이미지들을 화면 픽셀 형식으로 변환
+        self._layout_converted = False
+        self._convert_layout_surfaces()
+
+    def _convert_layout_surfaces(self):
+        # 화면이 만들어지기 전이면 변환하지 않고, 첫 그리기 때 다시 시도
+        if self._layout_converted or pygame.display.get_surface() is None:
+            return
+        self._grid_surface = convert_surface(self._grid_surface)
+        self._stone_sprites = {key: convert_surface(sprite, alpha=True) for key, sprite in self._stone_sprites.items()}
+        self._dim_overlay = convert_surface(self._dim_overlay, alpha=True)
+        self._layout_converted = True
+
+    def _layout_main_menu(self):
+        button_w = 300
+        button_h = 60
+        button_gap = 40  # 간격 넓힘
+        start_y = 220
+        center_x = self.screen_width // 2
+        self._main_menu_rects = {
+            name: pygame.Rect(center_x - button_w//2, start_y + i*(button_h + button_gap), button_w, button_h)
+            for i, (name, _, _) in enumerate(MAIN_MENU_BUTTONS)
+        }
+
+    def _layout_settings_panel(self):
+        panel_w, panel_h = 400, 480  # 패널 높이를 늘림
+        panel_x = (self.screen_width - panel_w)//2
+        panel_y = (self.screen_height - panel_h)//2
+        self._settings_panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
+        button_w = 300
+        button_h = 50
+        button_gap = 32  # 간격 넓힘
+        start_y = panel_y + 110
+        center_x = panel_x + panel_w//2
+        self._settings_rects = {
+            name: pygame.Rect(center_x - button_w//2, start_y + i*(button_h + button_gap), button_w, button_h)
+            for i, (name, _, _) in enumerate(SETTINGS_BUTTONS[:-1])
+        }
+        self._settings_rects['close_settings'] = pygame.Rect(center_x - 60, panel_y + panel_h - 80, 120, 40)  # Close 버튼을 더 아래로 이동
 
     def set_screen_size(self, width: int, height: int):
         self.screen_width = width
@@ -45,155 +148,185 @@ class Renderer:
         self.update_layout()
 
     def render_board(self, surface: pygame.Surface, board_state: np.ndarray, last_move=None):
-        # 바둑판 배경
-        board_rect = pygame.Rect(self.board_x, self.board_y, self.board_width, self.board_height)
-        pygame.draw.rect(surface, COLORS['LIGHT_BROWN'], board_rect)
-        # 격자
-        self._draw_grid(surface)
-        # 돌
-        self._draw_stones(surface, board_state, last_move)
-
-    def _draw_grid(self, surface: pygame.Surface):
-        start_x = self.board_x + self.cell_size
-        end_x = self.board_x + self.board_width - self.cell_size
-        start_y = self.board_y + self.cell_size
-        end_y = self.board_y + self.board_height - self.cell_size
+        # 돌 배치와 마지막 수가 그대로면 저장해 둔 바둑판 이미지를 그대로 사용
+        # 반환값: 이전 프레임과 달라진 화면 영역 목록
+        self._convert_layout_surfaces()
+        dirty_rects = []
+        board_key = (board_state.tobytes(), last_move)
+        if board_key != self._board_key:
+            if self._board_key is None:
+                dirty_rects.append(self.get_board_rect())
+            else:
+                dirty_rects.extend(self._changed_cell_rects(board_state, last_move))
+            # 바둑판 배경 + 격자
+            self._board_cache = self._grid_surface.copy()
+            # 돌
+            self._draw_stones(self._board_cache, board_state, last_move)
+            self._board_key = board_key
+            self._board_state = board_state.copy()
+            self._last_move = last_move
+        surface.blit(self._board_cache, (self.board_x, self.board_y))
+        return dirty_rects
+
+    def _changed_cell_rects(self, board_state: np.ndarray, last_move=None):
+        # 돌이 바뀐 칸과 마지막 수 표시가 옮겨진 칸의 돌 이미지 영역 (화면 좌표)
+        cells = np.argwhere(board_state != self._board_state).tolist()
+        for move in (self._last_move, last_move):
+            if move is not None:
+                cells.append(move)
+        offset = self._stone_offset
+        return [
+            pygame.Rect(self.board_x + self._col_x[col] - offset, self.board_y + self._row_y[row] - offset, 2 * offset, 2 * offset)
+            for row, col in cells
+        ]
+
+    def _render_grid(self, grid_surface: pygame.Surface):
+        # 바둑판 좌측 상단을 (0, 0)으로 하는 좌표로 격자를 그림
+        start = self.cell_size
+        end_x = self.board_width - self.cell_size
+        end_y = self.board_height - self.cell_size
         for i in range(self.board_size):
-            y = self.board_y + (i + 1) * self.cell_size
-            pygame.draw.line(surface, COLORS['BROWN'], (start_x, y), (end_x, y), 2)
+            y = (i + 1) * self.cell_size
+            pygame.draw.line(grid_surface, COLORS['BROWN'], (start, y), (end_x, y), 2)
         for j in range(self.board_size):
-            x = self.board_x + (j + 1) * self.cell_size
-            pygame.draw.line(surface, COLORS['BROWN'], (x, start_y), (x, end_y), 2)
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                x = self.board_x + (col + 1) * self.cell_size
-                y = self.board_y + (row + 1) * self.cell_size
-                pygame.draw.circle(surface, COLORS['BROWN'], (x, y), 3)
+            x = (j + 1) * self.cell_size
+            pygame.draw.line(grid_surface, COLORS['BROWN'], (x, start), (x, end_y), 2)
+        # 교차점 점: 점 이미지 하나를 모든 교차점에 한 번에 찍음
+        dot_radius = 3
+        dot = pygame.Surface((2 * dot_radius + 1, 2 * dot_radius + 1), pygame.SRCALPHA)
+        pygame.draw.circle(dot, COLORS['BROWN'], (dot_radius, dot_radius), dot_radius)
+        points = [(i + 1) * self.cell_size - dot_radius for i in range(self.board_size)]
+        blit_batch(grid_surface, [(dot, (x, y)) for y in points for x in points])
+
+    def _render_stone(self, player, is_last_move):
+        # 돌 중심을 (offset, offset)에 두고 그림자/테두리/마지막 수 표시까지 그림
+        stone_radius = self.stone_radius
+        offset = self._stone_offset
+        sprite = pygame.Surface((2 * offset, 2 * offset), pygame.SRCALPHA)
+        shadow_offset = 3
+        pygame.draw.circle(sprite, COLORS['GRAY'], (offset + shadow_offset, offset + shadow_offset), stone_radius)
+        pygame.draw.circle(sprite, get_stone_color(player), (offset, offset), stone_radius)
+        if player == 2:
+            pygame.draw.circle(sprite, COLORS['BLACK'], (offset, offset), stone_radius, 2)
+        if is_last_move:
+            pygame.draw.circle(sprite, COLORS['RED'], (offset, offset), stone_radius + 4, 3)
+        return sprite
 
     def _draw_stones(self, surface: pygame.Surface, board_state: np.ndarray, last_move=None):
-        stone_radius = int(self.cell_size * 0.4)
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                if board_state[row, col] != 0:
-                    x, y = board_to_screen_pos(row, col, pygame.Rect(self.board_x, self.board_y, self.board_width, self.board_height), self.board_size)
-                    stone_color = get_stone_color(board_state[row, col])
-                    is_last_move = last_move and (row, col) == last_move
-                    shadow_offset = 3
-                    pygame.draw.circle(surface, COLORS['GRAY'], (x + shadow_offset, y + shadow_offset), stone_radius)
-                    pygame.draw.circle(surface, stone_color, (x, y), stone_radius)
-                    if board_state[row, col] == 2:
-                        pygame.draw.circle(surface, COLORS['BLACK'], (x, y), stone_radius, 2)
-                    if is_last_move:
-                        pygame.draw.circle(surface, COLORS['RED'], (x, y), stone_radius + 4, 3)
+        # 돌이 놓인 칸만 골라 바둑판 내부 좌표를 한 번에 계산
+        occupied = np.argwhere(board_state != 0)
+        players = board_state[occupied[:, 0], occupied[:, 1]]
+        offset = self._stone_offset
+        xs = self._col_x[occupied[:, 1]] - offset
+        ys = self._row_y[occupied[:, 0]] - offset
+        stones = []
+        for (row, col), player, x, y in zip(occupied.tolist(), players.tolist(), xs.tolist(), ys.tolist()):
+            is_last_move = (row, col) == last_move
+            stones.append((self._stone_sprites[(player, is_last_move)], (x, y)))
+        blit_batch(surface, stones)
 
     def render_main_menu(self, surface, buttons):
+        # 메인 메뉴는 변하지 않으므로 레이아웃이 바뀐 뒤 처음 한 번만 그림
+        dirty_rects = []
+        if self._main_menu_surface is None:
+            self._main_menu_surface = convert_surface(pygame.Surface((self.screen_width, self.screen_height)))
+            self._render_main_menu(self._main_menu_surface)
+            dirty_rects.append(self._main_menu_surface.get_rect())
+        surface.blit(self._main_menu_surface, (0, 0))
+        buttons.update(self._main_menu_rects)
+        return dirty_rects
+
+    def _render_main_menu(self, surface):
         surface.fill((192, 192, 192))
         draw_text(surface, "3D Gomoku", self.title_font, COLORS['BLACK'], (self.screen_width // 2, 100))
-        button_w = 300
-        button_h = 60
-        button_gap = 40  # 간격 넓힘
-        start_y = 220
-        center_x = self.screen_width // 2
-        btn_2p = pygame.Rect(center_x - button_w//2, start_y, button_w, button_h)
-        pygame.draw.rect(surface, COLORS['GREEN'], btn_2p)
-        draw_text(surface, "2 Player Mode", self.button_font, COLORS['WHITE'], btn_2p.center)
-        buttons['2player'] = btn_2p
-        btn_easy = pygame.Rect(center_x - button_w//2, start_y + (button_h + button_gap), button_w, button_h)
-        pygame.draw.rect(surface, COLORS['BLUE'], btn_easy)
-        draw_text(surface, "AI Mode (Easy)", self.button_font, COLORS['WHITE'], btn_easy.center)
-        buttons['ai_easy'] = btn_easy
-        btn_normal = pygame.Rect(center_x - button_w//2, start_y + 2*(button_h + button_gap), button_w, button_h)
-        pygame.draw.rect(surface, COLORS['ORANGE'], btn_normal)
-        draw_text(surface, "AI Mode (Normal)", self.button_font, COLORS['WHITE'], btn_normal.center)
-        buttons['ai_normal'] = btn_normal
-        btn_hard = pygame.Rect(center_x - button_w//2, start_y + 3*(button_h + button_gap), button_w, button_h)
-        pygame.draw.rect(surface, COLORS['RED'], btn_hard)
-        draw_text(surface, "AI Mode (Hard)", self.button_font, COLORS['WHITE'], btn_hard.center)
-        buttons['ai_hard'] = btn_hard
+        self._draw_buttons(surface, MAIN_MENU_BUTTONS, self._main_menu_rects)
+
+    def _draw_buttons(self, surface, button_specs, rects):
+        # 버튼 배경은 한 번에 채우고 글자를 올림
+        fill_batch(surface, [(COLORS[color], rects[name]) for name, color, _ in button_specs])
+        for name, _, label in button_specs:
+            draw_text(surface, label, self.button_font, COLORS['WHITE'], rects[name].center)
 
     def render_settings_panel(self, surface, buttons):
-        overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((0,0,0,120))
-        surface.blit(overlay, (0,0))
-        panel_w, panel_h = 400, 480  # 패널 높이를 늘림
-        panel_x = (self.screen_width - panel_w)//2
-        panel_y = (self.screen_height - panel_h)//2
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
+        self._convert_layout_surfaces()
+        surface.blit(self._dim_overlay, (0,0))
+        panel_rect = self._settings_panel_rect
         pygame.draw.rect(surface, COLORS['WHITE'], panel_rect)
         pygame.draw.rect(surface, COLORS['BLACK'], panel_rect, 3)
-        draw_text(surface, "Settings", self.title_font, COLORS['BLACK'], (panel_x+panel_w//2, panel_y+50))
-        button_w = 300
-        button_h = 50
-        button_gap = 32  # 간격 넓힘
-        start_y = panel_y + 110
-        center_x = panel_x + panel_w//2
-        btn_2p = pygame.Rect(center_x - button_w//2, start_y, button_w, button_h)
-        pygame.draw.rect(surface, COLORS['GREEN'], btn_2p)
-        draw_text(surface, "2 Player Mode", self.button_font, COLORS['WHITE'], btn_2p.center)
-        buttons['set_2player'] = btn_2p
-        btn_easy = pygame.Rect(center_x - button_w//2, start_y + (button_h + button_gap), button_w, button_h)
-        pygame.draw.rect(surface, COLORS['BLUE'], btn_easy)
-        draw_text(surface, "AI Mode (Easy)", self.button_font, COLORS['WHITE'], btn_easy.center)
-        buttons['set_ai_easy'] = btn_easy
-        btn_normal = pygame.Rect(center_x - button_w//2, start_y + 2*(button_h + button_gap), button_w, button_h)
-        pygame.draw.rect(surface, COLORS['ORANGE'], btn_normal)
-        draw_text(surface, "AI Mode (Normal)", self.button_font, COLORS['WHITE'], btn_normal.center)
-        buttons['set_ai_normal'] = btn_normal
-        btn_hard = pygame.Rect(center_x - button_w//2, start_y + 3*(button_h + button_gap), button_w, button_h)
-        pygame.draw.rect(surface, COLORS['RED'], btn_hard)
-        draw_text(surface, "AI Mode (Hard)", self.button_font, COLORS['WHITE'], btn_hard.center)
-        buttons['set_ai_hard'] = btn_hard
-        btn_close = pygame.Rect(center_x - 60, panel_y + panel_h - 80, 120, 40)  # Close 버튼을 더 아래로 이동
-        pygame.draw.rect(surface, COLORS['GRAY'], btn_close)
-        draw_text(surface, "Close", self.button_font, COLORS['WHITE'], btn_close.center)
-        buttons['close_settings'] = btn_close
+        draw_text(surface, "Settings", self.title_font, COLORS['BLACK'], (panel_rect.centerx, panel_rect.y+50))
+        self._draw_buttons(surface, SETTINGS_BUTTONS, self._settings_rects)
+        buttons.update(self._settings_rects)
+        # 설정 패널은 매 프레임 같은 모습이므로 새로 바뀐 영역이 없음
+        return []
 
     def render_menu_panel(self, surface: pygame.Surface, current_player, game_mode, ai_difficulty, game_over, winner, buttons, show_settings_btn=True):
+        # 메뉴 패널은 게임 상태가 바뀔 때만 다시 그리고, 그 외에는 저장해 둔 이미지를 사용
+        menu_key = (current_player, game_mode, ai_difficulty, game_over, winner, show_settings_btn, self.screen_width, self.screen_height)
+        dirty_rects = []
+        if menu_key != self._menu_key:
+            dirty_rects.append(pygame.Rect(self.menu_x, self.menu_y, self.menu_width, self.menu_height))
+            self._menu_cache = convert_surface(pygame.Surface((self.menu_width, self.menu_height)))
+            panel_buttons = {}
+            self._render_menu_panel(self._menu_cache, current_player, game_mode, ai_difficulty, game_over, winner, panel_buttons, show_settings_btn)
+            self._menu_buttons = {name: rect.move(self.menu_x, self.menu_y) for name, rect in panel_buttons.items()}
+            self._menu_key = menu_key
+        surface.blit(self._menu_cache, (self.menu_x, self.menu_y))
+        buttons.update(self._menu_buttons)
+        return dirty_rects
+
+    def _render_menu_panel(self, panel: pygame.Surface, current_player, game_mode, ai_difficulty, game_over, winner, buttons, show_settings_btn):
+        # 메뉴 패널 좌측 상단을 (0, 0)으로 하는 좌표로 그림
         # 메뉴 패널 배경
-        menu_rect = pygame.Rect(self.menu_x, self.menu_y, self.menu_width, self.menu_height)
-        pygame.draw.rect(surface, COLORS['LIGHT_GRAY'], menu_rect)
+        menu_rect = pygame.Rect(0, 0, self.menu_width, self.menu_height)
+        pygame.draw.rect(panel, COLORS['LIGHT_GRAY'], menu_rect)
         # 타이틀
-        draw_text(surface, "3D Gomoku", self.title_font, COLORS['BLACK'], (self.menu_x + self.menu_width // 2, 40))
+        draw_text(panel, "3D Gomoku", self.title_font, COLORS['BLACK'], (self.menu_width // 2, 40))
         # 플레이어 정보
-        draw_text(surface, f"Player: {'Black' if current_player == 1 else 'White'}", self.info_font, COLORS['BLACK'], (self.menu_x + self.menu_width // 2, 100))
-        # 모드 정보
-        draw_text(surface, f"Mode: {game_mode} ({ai_difficulty})", self.info_font, COLORS['BLACK'], (self.menu_x + self.menu_width // 2, 140))
+        player_label = self._player_labels[1 if current_player == 1 else 2]
+        panel.blit(player_label, player_label.get_rect(center=(self.menu_width // 2, 100)))
+        # 모드 정보 (미리 렌더링하지 않은 조합이면 직접 그림)
+        mode_label = self._mode_labels.get((game_mode, ai_difficulty))
+        if mode_label is None:
+            draw_text(panel, f"Mode: {game_mode} ({ai_difficulty})", self.info_font, COLORS['BLACK'], (self.menu_width // 2, 140))
+        else:
+            panel.blit(mode_label, mode_label.get_rect(center=(self.menu_width // 2, 140)))
         # 버튼들
         button_w = self.menu_width - 60
         button_h = 50
         button_y = 200
         button_gap = 20
+        btn_new = pygame.Rect(30, button_y, button_w, button_h)
+        btn_restart = pygame.Rect(30, button_y + button_h + button_gap, button_w, button_h)
+        btn_win = pygame.Rect(30, button_y + 2 * (button_h + button_gap), button_w, button_h)
+        # 버튼 배경은 한 번에 채움
+        button_fills = [(COLORS['GREEN'], btn_new), (COLORS['ORANGE'], btn_restart)]
+        if game_over and winner:
+            button_fills.append((COLORS['GOLD'], btn_win))
+        fill_batch(panel, button_fills)
         # New Game
-        btn_new = pygame.Rect(self.menu_x + 30, button_y, button_w, button_h)
-        pygame.draw.rect(surface, COLORS['GREEN'], btn_new)
-        draw_text(surface, "New Game", self.button_font, COLORS['WHITE'], btn_new.center)
+        draw_text(panel, "New Game", self.button_font, COLORS['WHITE'], btn_new.center)
         buttons['new_game'] = btn_new
         # Restart
-        btn_restart = pygame.Rect(self.menu_x + 30, button_y + button_h + button_gap, button_w, button_h)
-        pygame.draw.rect(surface, COLORS['ORANGE'], btn_restart)
-        draw_text(surface, "Restart", self.button_font, COLORS['WHITE'], btn_restart.center)
+        draw_text(panel, "Restart", self.button_font, COLORS['WHITE'], btn_restart.center)
         buttons['restart'] = btn_restart
         # 승리 메시지
         if game_over and winner:
-            btn_win = pygame.Rect(self.menu_x + 30, button_y + 2 * (button_h + button_gap), button_w, button_h)
-            pygame.draw.rect(surface, COLORS['GOLD'], btn_win)
-            draw_text(surface, f"{'Black' if winner == 1 else 'White'} Wins!", self.button_font, COLORS['BLACK'], btn_win.center)
+            winner_label = self._winner_labels[1 if winner == 1 else 2]
+            panel.blit(winner_label, winner_label.get_rect(center=btn_win.center))
             buttons['winner'] = btn_win
         # 우측 하단 설정(톱니바퀴) 버튼
         if show_settings_btn:
             size = 48
             margin = 20
-            btn_settings = pygame.Rect(self.menu_x + self.menu_width - size - margin, self.menu_height - size - margin, size, size)
-            pygame.draw.circle(surface, COLORS['DARK_GRAY'], btn_settings.center, size//2)
-            pygame.draw.circle(surface, COLORS['BLACK'], btn_settings.center, size//2, 3)
+            btn_settings = pygame.Rect(self.menu_width - size - margin, self.menu_height - size - margin, size, size)
+            pygame.draw.circle(panel, COLORS['DARK_GRAY'], btn_settings.center, size//2)
+            pygame.draw.circle(panel, COLORS['BLACK'], btn_settings.center, size//2, 3)
             # 간단한 톱니바퀴 아이콘
             cx, cy = btn_settings.center
-            for i in range(8):
-                import math
-                angle = i * 45
-                x = cx + int((size//2-8) * math.cos(math.radians(angle)))
-                y = cy + int((size//2-8) * math.sin(math.radians(angle)))
-                pygame.draw.circle(surface, COLORS['BLACK'], (x, y), 4)
+            for dx, dy in self._gear_offsets:
+                x = cx + int((size//2-8) * dx)
+                y = cy + int((size//2-8) * dy)
+                pygame.draw.circle(panel, COLORS['BLACK'], (x, y), 4)
             buttons['settings'] = btn_settings
 
     def get_board_rect(self):
@@ -13,6 +13,20 @@ import pygame
 import time
 from board import Board
 from ai import AI
+from ai_kernels import evaluate_position, line_score, score_line
+
+def warm_up_ai():
+    """
+    AI 계산 커널 예열
+
+    더미 바둑판으로 Numba 커널을 한 번씩 호출해 두어,
+    첫 수의 계산 시간에 커널 로딩 시간이 섞이지 않도록 합니다.
+    """
+    board = Board()
+    board.place_stone(7, 7, 1)
+    evaluate_position(board.board, 7, 7, 1)
+    score_line(board.board[7])
+    line_score(1, 0)
 
 def test_ai_vs_ai():
     """
@@ -42,6 +56,9 @@ def test_ai_vs_ai():
     print("AI 1 (Black) vs AI 2 (White)")
     print("AI 1 depth: 2, AI 2 depth: 3")
     print()
+
+    # 수 계산 시간이 정상 상태의 값을 나타내도록 미리 예열
+    warm_up_ai()
     
     while move_count < max_moves:
         # 현재 플레이어 결정
@@ -104,13 +121,19 @@ def test_ai_performance():
     ]
     
     results = []
+
+    # 수 계산 시간이 정상 상태의 값을 나타내도록 미리 예열
+    warm_up_ai()
+
+    # 바둑판은 하나만 만들어 두고 대전마다 초기화하여 재사용
+    board = Board()
     
     for test_name, opponent_name, depth1, depth2 in test_cases:
         print(f"\n{test_name} vs {opponent_name}")
         print("-" * 30)
         
         # 게임 실행
-        board = Board()
+        board.reset()
         ai1 = AI(depth=depth1)
         ai2 = AI(depth=depth2)
         
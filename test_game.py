@@ -9,9 +9,13 @@ Author: 3D Gomoku Development Team
 Version: 1.0
 """
 
+import os
 import unittest
+from unittest import mock
+import pygame
 from board import Board
 from ai import AI
+from game import Game
 
 class TestBoard(unittest.TestCase):
     """
@@ -82,8 +86,7 @@ class TestBoard(unittest.TestCase):
         가로로 5개 연속이 되었을 때 승리 판정이 올바르게 되는지 확인합니다.
         """
         # 가로로 5개 연속 놓기
-        for i in range(5):
-            self.board.place_stone(i, 7, 1)
+        self.board.place_stones([(i, 7) for i in range(5)], 1)
         
         # 마지막 돌에서 승리 확인
         self.assertTrue(self.board.check_win(4, 7, 1))
@@ -95,8 +98,7 @@ class TestBoard(unittest.TestCase):
         세로로 5개 연속이 되었을 때 승리 판정이 올바르게 되는지 확인합니다.
         """
         # 세로로 5개 연속 놓기
-        for i in range(5):
-            self.board.place_stone(7, i, 1)
+        self.board.place_stones([(7, i) for i in range(5)], 1)
         
         # 마지막 돌에서 승리 확인
         self.assertTrue(self.board.check_win(7, 4, 1))
@@ -108,12 +110,37 @@ class TestBoard(unittest.TestCase):
         대각선으로 5개 연속이 되었을 때 승리 판정이 올바르게 되는지 확인합니다.
         """
         # 우하향 대각선으로 5개 연속 놓기
-        for i in range(5):
-            self.board.place_stone(i, i, 1)
+        self.board.place_stones([(i, i) for i in range(5)], 1)
         
         # 마지막 돌에서 승리 확인
         self.assertTrue(self.board.check_win(4, 4, 1))
     
+    def test_anti_diagonal_win(self):
+        """
+        우상향 대각선 승리 테스트
+
+        우상향 대각선으로 5개 연속이 되었을 때 승리 판정이 올바르게 되는지 확인합니다.
+        """
+        for i in range(5):
+            self.board.place_stone(10 + i, 4 - i, 2)
+
+        self.assertTrue(self.board.check_win(12, 2, 2))
+        self.assertFalse(self.board.check_win(12, 2, 1))
+
+    def test_no_wrap_around_win(self):
+        """
+        줄 넘김 테스트
+
+        행 끝과 다음 행 시작에 걸친 5개는 승리가 아닌지 확인합니다.
+        """
+        for x in (12, 13, 14):
+            self.board.place_stone(x, 6, 1)
+        for x in (0, 1):
+            self.board.place_stone(x, 7, 1)
+
+        self.assertFalse(self.board.check_win(0, 7, 1))
+        self.assertFalse(self.board.check_win(14, 6, 1))
+
     def test_no_win(self):
         """
         승리하지 않은 상황 테스트
@@ -121,12 +148,136 @@ class TestBoard(unittest.TestCase):
         승리 조건을 만족하지 않았을 때 승리 판정이 False를 반환하는지 확인합니다.
         """
         # 4개만 연속으로 놓기
-        for i in range(4):
-            self.board.place_stone(i, 7, 1)
+        self.board.place_stones([(i, 7) for i in range(4)], 1)
         
         # 승리하지 않았는지 확인
         self.assertFalse(self.board.check_win(3, 7, 1))
 
+    def test_place_stones(self):
+        """
+        여러 돌 한 번에 놓기 테스트
+        
+        한 번에 놓은 결과가 하나씩 놓은 결과와 같고, 잘못된 좌표가 섞이면 아무것도 놓지 않는지 확인합니다.
+        """
+        coords = [(3, 3), (4, 4), (5, 3), (3, 9), (10, 2)]
+        self.assertTrue(self.board.place_stones(coords, 2))
+        other = Board()
+        for x, y in coords:
+            other.place_stone(x, y, 2)
+        self.assertTrue((self.board.board == other.board).all())
+        self.assertEqual(self.board.hash, other.hash)
+        self.assertEqual(self.board.white_bb, other.white_bb)
+        self.assertEqual(self.board.stone_count, other.stone_count)
+        self.assertEqual(self.board.score, other.score)
+        
+        # 이미 돌이 있는 칸, 범위 밖, 중복 좌표
+        self.assertFalse(self.board.place_stones([(0, 0), (3, 3)], 1))
+        self.assertFalse(self.board.place_stones([(0, 0), (15, 0)], 1))
+        self.assertFalse(self.board.place_stones([(0, 0), (0, 0)], 1))
+        self.assertEqual(self.board.board[0][0], 0)
+    
+    def test_reset(self):
+        """
+        바둑판 초기화 테스트
+        
+        초기화 후 같은 배열을 유지한 채 돌, 해시, 비트보드, 돌 개수, 점수가 모두 비워지는지 확인합니다.
+        """
+        cells = self.board.board
+        self.board.place_stones([(i, 7) for i in range(4)], 1)
+        self.board.place_stone(8, 8, 2)
+        self.board.reset()
+        
+        self.assertIs(self.board.board, cells)
+        self.assertFalse(self.board.board.any())
+        self.assertEqual(self.board.hash, 0)
+        self.assertEqual((self.board.black_bb, self.board.white_bb), (0, 0))
+        self.assertEqual(self.board.stone_count, 0)
+        self.assertEqual(self.board.score, [0, 0, 0])
+        self.assertEqual(self.board.get_winning_moves(1), [])
+    
+    def test_zobrist_hash(self):
+        """
+        Zobrist 해시 테스트
+
+        수순이 달라도 같은 국면이면 해시가 같고, 돌을 되돌리면 원래 해시로 돌아오는지 확인합니다.
+        """
+        other = Board()
+        self.board.place_stone(7, 7, 1)
+        self.board.place_stone(8, 8, 2)
+        other.place_stone(8, 8, 2)
+        other.place_stone(7, 7, 1)
+        self.assertEqual(self.board.hash, other.hash)
+
+        # 돌 되돌리기
+        self.board.remove_stone(8, 8)
+        self.board.remove_stone(7, 7)
+        self.assertEqual(self.board.hash, 0)
+        self.assertEqual(self.board.board[7][7], 0)
+
+    def test_symmetric_hash(self):
+        """
+        대칭 해시 테스트
+
+        회전/반사한 국면의 해시가 대칭 해시와 같고, 대표 키가 서로 같은지 확인합니다.
+        """
+        stones = [(7, 7, 1), (8, 6, 2), (9, 7, 1), (3, 12, 2)]
+        for x, y, player in stones:
+            self.board.place_stone(x, y, player)
+
+        for k in range(8):
+            other = Board()
+            for x, y, player in stones:
+                other.place_stone(*self.board.transform_move((x, y), k), player)
+            self.assertEqual(other.hash, self.board.hashes[k])
+            self.assertEqual(other.canonical_key()[0], self.board.canonical_key()[0])
+            self.assertEqual(self.board.inverse_transform_move(self.board.transform_move((3, 12), k), k), (3, 12))
+
+    def test_is_full(self):
+        """
+        바둑판 가득 참 테스트
+
+        돌 개수가 놓기/되돌리기에 맞춰 갱신되고, 모든 칸이 차면 가득 찬 것으로 판정하는지 확인합니다.
+        """
+        for y in range(self.board.size):
+            for x in range(self.board.size):
+                self.board.place_stone(x, y, 1 + (x + y) % 2)
+        self.assertTrue(self.board.is_full())
+
+        self.board.remove_stone(0, 0)
+        self.assertEqual(self.board.stone_count, self.board.size * self.board.size - 1)
+        self.assertFalse(self.board.is_full())
+
+    def test_winning_moves(self):
+        """
+        즉시 승리 수 테스트
+
+        4개 연속의 양 끝과 중간이 빈 4개짜리 줄의 빈 칸을 승리 수로 찾는지 확인합니다.
+        """
+        for i in range(1, 5):
+            self.board.place_stone(i, 7, 1)
+        self.assertEqual(self.board.get_winning_moves(1), [(0, 7), (5, 7)])
+        self.assertEqual(self.board.get_winning_moves(2), [])
+
+        # 대각선으로 중간 한 칸이 빈 경우
+        for i in (0, 1, 3, 4):
+            self.board.place_stone(10 + i, i, 2)
+        self.assertEqual(self.board.get_winning_moves(2), [(12, 2)])
+
+    def test_candidate_moves(self):
+        """
+        후보 수 테스트
+
+        빈 바둑판에서는 중앙만, 돌이 있으면 주변 빈 칸만 후보가 되는지 확인합니다.
+        """
+        self.assertEqual(self.board.get_candidate_moves(), [(7, 7)])
+
+        self.board.place_stone(0, 0, 1)
+        moves = self.board.get_candidate_moves(radius=2)
+        self.assertEqual(len(moves), 8)  # 3x3 영역에서 돌이 놓인 칸 제외
+        self.assertNotIn((0, 0), moves)
+        self.assertIn((2, 2), moves)
+        self.assertNotIn((3, 0), moves)
+
 class TestAI(unittest.TestCase):
     """
     AI 테스트 클래스
@@ -182,6 +333,76 @@ class TestAI(unittest.TestCase):
         self.assertIsNotNone(move)
         self.assertTrue(self.board.is_valid_move(move[0], move[1]))
 
+    def test_game_over_last_move(self):
+        """
+        게임 종료 판정 테스트
+
+        마지막 수로 5개 연속이 만들어졌을 때만 종료로 판정하는지 확인합니다.
+        """
+        for i in range(4):
+            self.board.place_stone(i, 7, 1)
+        self.assertFalse(self.ai.is_game_over(self.board, (3, 7)))
+
+        self.board.place_stone(4, 7, 1)
+        self.assertTrue(self.ai.is_game_over(self.board, (4, 7)))
+
+    def test_incremental_score(self):
+        """
+        증분 평가 테스트
+
+        바둑판이 갱신하는 점수가 모든 돌을 하나씩 평가한 합과 같은지 확인합니다.
+        """
+        moves = [(7, 7), (8, 8), (7, 8), (6, 6), (7, 9), (7, 6), (9, 9), (5, 5), (6, 8), (8, 7)]
+        for i, (x, y) in enumerate(moves):
+            self.board.place_stone(x, y, 1 + i % 2)
+        self.board.remove_stone(9, 9)
+
+        for player in (1, 2):
+            expected = sum(self.ai.evaluate_position(self.board, x, y, player)
+                           for y in range(self.board.size)
+                           for x in range(self.board.size)
+                           if self.board.board[y][x] == player)
+            self.assertEqual(self.board.score[player], expected)
+
+class TestGame(unittest.TestCase):
+    """
+    게임 화면 갱신 테스트 클래스
+    
+    화면이 다시 보이게 되었을 때 전체 화면을 갱신하는지 테스트합니다.
+    """
+    
+    def setUp(self):
+        """
+        테스트 설정
+        
+        실제 창 없이 동작하도록 더미 비디오 드라이버로 게임을 생성합니다.
+        """
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        self.game = Game()
+    
+    def tearDown(self):
+        """
+        테스트 정리
+        """
+        pygame.quit()
+    
+    def test_window_exposed_redraw(self):
+        """
+        창 다시 보이기 테스트
+        
+        변화가 없는 화면에서도 창이 다시 보이게 되면 다음 그리기에서 전체 화면을 갱신하는지 확인합니다.
+        """
+        self.game.render()
+        with mock.patch('pygame.display.flip') as flip:
+            # 바뀐 것이 없으면 전체 갱신하지 않음
+            self.game.render()
+            flip.assert_not_called()
+            
+            pygame.event.post(pygame.event.Event(pygame.WINDOWEXPOSED))
+            self.game.handle_events()
+            self.game.render()
+            flip.assert_called_once()
+
 def run_tests():
     """
     테스트 실행 함수
@@ -197,6 +418,7 @@ def run_tests():
     # 테스트 클래스들 추가
     test_suite.addTest(unittest.makeSuite(TestBoard))
     test_suite.addTest(unittest.makeSuite(TestAI))
+    test_suite.addTest(unittest.makeSuite(TestGame))
     
     # 테스트 실행
     runner = unittest.TextTestRunner(verbosity=2)
@@ -31,6 +31,8 @@ COLORS = {
     'DARK_BLUE': (0, 0, 139),
     'DARK_PURPLE': (75, 0, 130)
 }
+# 그리기 함수에 넘길 때마다 튜플을 변환하지 않도록 pygame.Color로 미리 만들어 둠
+COLORS = {name: pygame.Color(*rgb) for name, rgb in COLORS.items()}
 
 def get_stone_color(player: int):
     if player == 1:
@@ -55,8 +57,16 @@ def screen_to_board_pos(screen_x, screen_y, board_rect, board_size):
         return row, col
     return -1, -1
 
+# 렌더링한 글자 이미지 캐시: (글자, 폰트, 색상) -> Surface
+_TEXT_CACHE = {}
+
 def draw_text(surface, text, font, color, pos, align='center'):
-    text_surface = font.render(text, True, color)
+    # 같은 글자를 매 프레임 다시 래스터화하지 않도록 한 번 렌더링한 이미지를 재사용
+    # pygame.Color는 해시할 수 없으므로 튜플로 바꿔 키로 사용
+    key = (text, id(font), tuple(color))
+    text_surface = _TEXT_CACHE.get(key)
+    if text_surface is None:
+        text_surface = _TEXT_CACHE[key] = font.render(text, True, color)
     text_rect = text_surface.get_rect()
     if align == 'center':
         text_rect.center = pos
@@ -65,4 +75,26 @@ def draw_text(surface, text, font, color, pos, align='center'):
     elif align == 'right':
         text_rect.midright = pos
     surface.blit(text_surface, text_rect)
-    return text_rect 
\ No newline at end of file
+    return text_rect 
+
+def blit_batch(surface, blit_sequence):
+    # pygame-ce의 fblits가 있으면 사용하고, 없으면 blits로 한 번에 그림
+    if hasattr(surface, 'fblits'):
+        surface.fblits(blit_sequence)
+    else:
+        surface.blits(blit_sequence, doreturn=False)
+
+def fill_batch(surface, fill_sequence):
+    # pygame-ce의 fills가 있으면 한 번에 채우고, 없으면 하나씩 채움
+    if hasattr(surface, 'fills'):
+        surface.fills(fill_sequence)
+    else:
+        for color, rect in fill_sequence:
+            surface.fill(color, rect)
+
+def convert_surface(surface, alpha=False):
+    # 화면과 같은 픽셀 형식으로 바꿔 blit 할 때마다 형식 변환이 일어나지 않도록 함
+    # 화면(display)이 아직 만들어지지 않았으면 변환할 수 없으므로 그대로 반환
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()